@@ -1,10 +1,16 @@
 #!/usr/bin/env python3
 """Linux System Monitoring Tool - Similar to htop"""
 
+import os
 import time
+import heapq
+import queue
 import signal
+import threading
+import platform
 import argparse
-from datetime import datetime
+from collections import namedtuple
+from datetime import datetime, timezone
 import psutil
 from rich.console import Console
 from rich.layout import Layout
@@ -15,27 +21,113 @@ from rich.text import Text
 
 try:
     import boto3
-    from botocore.exceptions import NoCredentialsError
     CLOUDWATCH_AVAILABLE = True
 except ImportError:
     CLOUDWATCH_AVAILABLE = False
 
+CpuInfo = namedtuple('CpuInfo', 'total count per_core frequency')
+MemInfo = namedtuple('MemInfo', 'total available used percent swap_total swap_used swap_percent')
+DiskRec = namedtuple('DiskRec', 'device mountpoint percent used total')
+NetInfo = namedtuple('NetInfo', 'bytes_sent bytes_recv packets_sent packets_recv errin errout connections')
+ProcRec = namedtuple('ProcRec', 'pid name cpu_percent memory_percent status')
+
+# Collector and render loop period, in seconds
+_REFRESH_INTERVAL = 0.5
+
+_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+_SHIFTS = (0, 10, 20, 30, 40, 50)
+
+# /proc/[pid]/stat state letters mapped to the names psutil reports
+_PROC_STATUS = {
+    b'R': 'running', b'S': 'sleeping', b'D': 'disk-sleep', b'T': 'stopped', b't': 'tracing-stop',
+    b'Z': 'zombie', b'X': 'dead', b'x': 'dead', b'K': 'wake-kill', b'W': 'waking', b'I': 'idle', b'P': 'parked'
+}
+
+# Reused read buffer for _count_lines; only the collecting thread touches it
+_SCRATCH = bytearray(65536)
+
+
+def _read_proc(path):
+    # Unbuffered single read; per-pid procfs files fit in one page
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return os.read(fd, 4096)
+    finally:
+        os.close(fd)
+
+
+def _count_lines(path):
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        lines = 0
+        while True:
+            n = os.readv(fd, [_SCRATCH])
+            if not n:
+                break
+            lines += _SCRATCH.count(b'\n', 0, n)
+        return lines
+    finally:
+        os.close(fd)
+
 
 class SystemMonitor:
-    def __init__(self, cloudwatch_enabled=False, cloudwatch_region='us-east-1', namespace='SystemMonitor'):
+    __slots__ = (
+        'console', 'cloudwatch_enabled', 'cloudwatch', 'namespace', 'detailed_disk_metrics', 'running', 'layout',
+        '_cpu_count', '_cpu_primed_at', '_mem_total', '_use_procfs', '_clk_tck', '_page_size', '_proc_prev',
+        '_cache', '_partitions', '_partitions_ts', '_cw_queue', '_bar50', '_bar25', '_bar20', '_colored_bar',
+        '_last_sec', '_header_panel', '_snap', '_snap_lock', '_cpu_slot', '_mem_slot', '_disk_slot', '_network_slot',
+        '_processes_slot', '_disk_table', '_disk_panel', '_proc_table', '_proc_panel'
+    )
+    
+    _COLOR_TAGS = {'green': ('[green]', '[/green]'), 'yellow': ('[yellow]', '[/yellow]'), 'red': ('[red]', '[/red]')}
+    _STATUS_MARKUP = {
+        status: f"[green]{status}[/green]" if status == 'running' else f"[yellow]{status}[/yellow]"
+        for status in ('running', 'sleeping', 'disk-sleep', 'stopped', 'tracing-stop', 'zombie',
+                       'dead', 'wake-kill', 'waking', 'idle', 'parked', 'locked', 'waiting', 'suspended')
+    }
+    
+    def __init__(self, cloudwatch_enabled=False, cloudwatch_region='us-east-1', namespace='SystemMonitor',
+                 detailed_disk_metrics=False):
         self.console = Console()
         self.cloudwatch_enabled = cloudwatch_enabled and CLOUDWATCH_AVAILABLE
+        self.detailed_disk_metrics = detailed_disk_metrics
         self.running = True
+        self._cpu_count = psutil.cpu_count()
+        self._mem_total = psutil.virtual_memory().total
+        # Seed psutil's per-CPU counters so the first non-blocking sample has a baseline
+        psutil.cpu_percent(interval=None, percpu=True)
+        self._cpu_primed_at = time.monotonic()
+        self._use_procfs = platform.system() == 'Linux'
+        if self._use_procfs:
+            self._clk_tck = os.sysconf('SC_CLK_TCK')
+            self._page_size = os.sysconf('SC_PAGE_SIZE')
+            self._proc_prev = {}
+        self._cache = {}
+        self._partitions = None
+        self._partitions_ts = 0
         
         if self.cloudwatch_enabled:
             try:
                 self.cloudwatch = boto3.client('cloudwatch', region_name=cloudwatch_region)
                 self.namespace = namespace
                 self.console.print(f"[green]CloudWatch enabled (region: {cloudwatch_region})[/green]")
-            except (NoCredentialsError, Exception) as e:
+                # PutMetricData runs on a daemon thread so HTTPS round-trips never stall the UI loop
+                self._cw_queue = queue.Queue(maxsize=10)
+                threading.Thread(target=self._cw_worker, daemon=True).start()
+            except Exception as e:
                 self.console.print(f"[yellow]CloudWatch disabled: {e}[/yellow]")
                 self.cloudwatch_enabled = False
         
+        # Bars indexed by integer percent (0-100) for the CPU/memory, per-core and disk widths
+        self._bar50 = ["█" * (i // 2) + "░" * (50 - i // 2) for i in range(101)]
+        self._bar25 = ["█" * (i // 4) + "░" * (25 - i // 4) for i in range(101)]
+        self._bar20 = ["█" * (i // 5) + "░" * (20 - i // 5) for i in range(101)]
+        # CPU/memory bars with their green/yellow/red markup already applied
+        self._colored_bar = [f"[{self._color(i)}]{self._bar50[i]}[/{self._color(i)}]" for i in range(101)]
+        self._last_sec = None
+        self._snap = None
+        self._snap_lock = threading.Lock()
+        self._build_layout_skeleton()
         signal.signal(signal.SIGINT, self._signal_handler)
         signal.signal(signal.SIGTERM, self._signal_handler)
     
@@ -43,189 +135,331 @@ class SystemMonitor:
         self.running = False
     
     def get_cpu_info(self):
-        return {
-            'total': psutil.cpu_percent(interval=0.1),
-            'count': psutil.cpu_count(),
-            'per_core': psutil.cpu_percent(interval=0.1, percpu=True),
-            'frequency': psutil.cpu_freq().current if psutil.cpu_freq() else None
-        }
+        # Non-blocking sampling: psutil diffs against the previous call, so the
+        # refresh sleep in run() acts as the measurement interval.
+        per_core = psutil.cpu_percent(interval=None, percpu=True)
+        return CpuInfo(
+            total=sum(per_core) / len(per_core) if per_core else 0.0,
+            count=self._cpu_count,
+            per_core=per_core,
+            frequency=self._throttle('cpu_freq', 1.0, self.get_cpu_frequency)
+        )
+    
+    def get_cpu_frequency(self):
+        # The first "cpu MHz" line is enough for display and avoids psutil's per-CPU sysfs reads
+        if self._use_procfs:
+            try:
+                with open('/proc/cpuinfo', 'rb') as f:
+                    for line in f:
+                        if line.startswith(b'cpu MHz'):
+                            return float(line.split(b':', 1)[1])
+            except (OSError, ValueError):
+                pass
+        freq = psutil.cpu_freq()
+        return freq.current if freq else None
     
     def get_memory_info(self):
         mem = psutil.virtual_memory()
         swap = psutil.swap_memory()
-        return {
-            'total': mem.total, 'available': mem.available, 'used': mem.used, 'percent': mem.percent,
-            'swap_total': swap.total, 'swap_used': swap.used, 'swap_percent': swap.percent
-        }
+        return MemInfo(
+            total=self._mem_total, available=mem.available, used=mem.used, percent=mem.percent,
+            swap_total=swap.total, swap_used=swap.used, swap_percent=swap.percent
+        )
+    
+    def _throttle(self, key, ttl, func):
+        # Return the last value of func() while it is younger than ttl seconds. Callers run on
+        # _REFRESH_INTERVAL ticks, so allow half a tick of slack; otherwise sleep jitter lands
+        # ticks just short of the TTL and each refresh slips by a whole tick.
+        now = time.monotonic()
+        cached = self._cache.get(key)
+        if cached is None or now - cached[1] >= ttl - _REFRESH_INTERVAL / 2:
+            cached = self._cache[key] = (func(), now)
+        return cached[0]
     
     def get_disk_info(self):
-        return [{
-            'device': p.device, 'mountpoint': p.mountpoint, 'percent': psutil.disk_usage(p.mountpoint).percent,
-            'used': psutil.disk_usage(p.mountpoint).used, 'total': psutil.disk_usage(p.mountpoint).total
-        } for p in psutil.disk_partitions() if self._check_disk(p)]
+        # The mount table rarely changes, so re-read it only once a minute
+        now = time.monotonic()
+        if self._partitions is None or now - self._partitions_ts >= 60.0:
+            self._partitions = psutil.disk_partitions(all=False)
+            self._partitions_ts = now
+        disks = []
+        for p in self._partitions:
+            # One statvfs per mount; unreadable mounts are skipped
+            try:
+                usage = psutil.disk_usage(p.mountpoint)
+            except (PermissionError, OSError):
+                continue
+            disks.append(DiskRec(p.device, p.mountpoint, usage.percent, usage.used, usage.total))
+        return disks
     
-    def _check_disk(self, partition):
+    def _count_inet_sockets(self):
+        # Same sockets as net_connections(kind='inet'): one line each after a single header line
+        count = 0
+        for path in ('/proc/net/tcp', '/proc/net/tcp6', '/proc/net/udp', '/proc/net/udp6'):
+            try:
+                count += max(_count_lines(path) - 1, 0)
+            except FileNotFoundError:
+                continue
+        return count
+    
+    def get_connection_count(self):
+        if self._use_procfs:
+            try:
+                return self._count_inet_sockets()
+            except OSError:
+                pass
         try:
-            psutil.disk_usage(partition.mountpoint)
-            return True
-        except (PermissionError, OSError):
-            return False
+            return len(psutil.net_connections(kind='inet'))
+        except (psutil.AccessDenied, PermissionError):
+            return 0
     
     def get_network_info(self):
         net_io = psutil.net_io_counters()
-        try:
-            connections = len(psutil.net_connections())
-        except (psutil.AccessDenied, PermissionError):
-            connections = 0
-        return {
-            'bytes_sent': net_io.bytes_sent, 'bytes_recv': net_io.bytes_recv,
-            'packets_sent': net_io.packets_sent, 'packets_recv': net_io.packets_recv,
-            'errin': net_io.errin, 'errout': net_io.errout,
-            'connections': connections
-        }
+        # net_connections() is the slowest psutil call; refresh the count every 5 s at most
+        connections = self._throttle('connections', 5.0, self.get_connection_count)
+        return NetInfo(
+            bytes_sent=net_io.bytes_sent, bytes_recv=net_io.bytes_recv,
+            packets_sent=net_io.packets_sent, packets_recv=net_io.packets_recv,
+            errin=net_io.errin, errout=net_io.errout,
+            connections=connections
+        )
     
-    def get_process_info(self, limit=10):
-        processes = []
-        for proc in psutil.process_iter():
+    @staticmethod
+    def _push_top(heap, limit, item):
+        # Bounded min-heap keyed on item[0]: keeps only the `limit` largest items seen so far
+        if len(heap) < limit:
+            heapq.heappush(heap, item)
+        elif item[0] > heap[0][0]:
+            heapq.heapreplace(heap, item)
+    
+    def _scan_proc_linux(self, limit):
+        # One raw read of /proc/[pid]/stat per process; CPU% is the tick delta since the last scan.
+        # Only the current top `limit` candidates are kept, and only those become records.
+        now = time.monotonic()
+        prev, seen, heap = self._proc_prev, {}, []
+        for entry in os.listdir('/proc'):
+            if not entry.isdigit():
+                continue
             try:
-                with proc.oneshot():
-                    processes.append({
-                        'pid': proc.pid, 'name': proc.name(),
-                        'cpu_percent': proc.cpu_percent(interval=0) or 0.0,
-                        'memory_percent': proc.memory_percent() or 0.0,
-                        'status': proc.status()
-                    })
-            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess, Exception):
+                data = _read_proc(f'/proc/{entry}/stat')
+            except OSError:
+                # Exited, or hidden from us (hidepid/invisible=noaccess): skip just this pid
+                continue
+            # comm may contain spaces or parentheses, so split on the last ')'
+            head, sep, tail = data.rpartition(b')')
+            fields = tail.split()
+            if not sep or len(fields) < 22:
                 continue
-        processes.sort(key=lambda x: x['cpu_percent'], reverse=True)
-        return processes[:limit]
+            pid = int(entry)
+            ticks = int(fields[11]) + int(fields[12])
+            seen[pid] = (ticks, now)
+            last = prev.get(pid)
+            pct = 0.0
+            if last and now > last[1]:
+                pct = max(ticks - last[0], 0) / (self._clk_tck * (now - last[1])) * 100
+            self._push_top(heap, limit, (pct, pid, head, fields[0], fields[21]))
+        self._proc_prev = seen
+        mem_scale = self._page_size / self._mem_total * 100
+        return [
+            ProcRec(pid, head.split(b'(', 1)[1].decode(errors='replace'), pct, int(rss) * mem_scale,
+                    _PROC_STATUS.get(state, '?'))
+            for pct, pid, head, state, rss in sorted(heap, reverse=True)
+        ]
     
-    def format_bytes(self, bytes_value):
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if bytes_value < 1024.0:
-                return f"{bytes_value:.2f} {unit}"
-            bytes_value /= 1024.0
-        return f"{bytes_value:.2f} PB"
+    def get_process_info(self, limit=10):
+        if self._use_procfs:
+            return self._scan_proc_linux(limit)
+        # process_iter(attrs=...) fetches the attributes under oneshot() and skips vanished processes
+        heap = []
+        for proc in psutil.process_iter(attrs=['pid', 'name', 'cpu_percent', 'memory_percent', 'status']):
+            info = proc.info
+            rec = ProcRec(info['pid'], info['name'] or '', info['cpu_percent'] or 0.0,
+                          info['memory_percent'] or 0.0, info['status'] or '?')
+            self._push_top(heap, limit, (rec.cpu_percent, rec.pid, rec))
+        return [rec for _, _, rec in sorted(heap, reverse=True)]
     
-    def _bar(self, percent, length=50):
-        filled = int(percent / (100 / length))
-        return "█" * filled + "░" * (length - filled)
+    @staticmethod
+    def format_bytes(bytes_value):
+        if bytes_value < 1024:
+            return f"{bytes_value:.2f} B"
+        # bit_length picks the 1024-power directly; PB is the largest unit
+        unit = min(int(bytes_value).bit_length() - 1, 59) // 10
+        return f"{bytes_value / (1 << _SHIFTS[unit]):.2f} {_UNITS[unit]}"
     
     def _color(self, value, thresholds=(50, 80)):
         return "green" if value < thresholds[0] else "yellow" if value < thresholds[1] else "red"
     
     def create_cpu_panel(self, cpu_info):
         table = Table(show_header=False, box=None, padding=(0, 1))
-        cpu_percent = cpu_info['total']
+        cpu_percent = cpu_info.total
         table.add_row("CPU Usage:", f"[bold]{cpu_percent:.1f}%[/bold]")
-        table.add_row("Cores:", str(cpu_info['count']))
-        if cpu_info['frequency']:
-            table.add_row("Frequency:", f"{cpu_info['frequency']:.0f} MHz")
-        table.add_row("", f"[{self._color(cpu_percent)}]{self._bar(cpu_percent)}[/{self._color(cpu_percent)}]")
+        table.add_row("Cores:", str(cpu_info.count))
+        if cpu_info.frequency:
+            table.add_row("Frequency:", f"{cpu_info.frequency:.0f} MHz")
+        table.add_row("", self._colored_bar[int(cpu_percent)])
         
-        if len(cpu_info['per_core']) <= 8:
+        if len(cpu_info.per_core) <= 8:
             table.add_row("", ""); table.add_row("Per Core:", "")
-            for i, core in enumerate(cpu_info['per_core']):
-                bar = "█" * int(core / 4) + "░" * (25 - int(core / 4))
-                table.add_row(f"  Core {i}:", f"[{self._color(core)}]{core:5.1f}% {bar}[/{self._color(core)}]")
+            for i, core in enumerate(cpu_info.per_core):
+                open_tag, close_tag = self._COLOR_TAGS[self._color(core)]
+                table.add_row(f"  Core {i}:", f"{open_tag}{core:5.1f}% {self._bar25[int(core)]}{close_tag}")
         return Panel(table, title="[bold cyan]CPU[/bold cyan]", border_style="cyan")
     
     def create_memory_panel(self, mem_info):
         table = Table(show_header=False, box=None, padding=(0, 1))
-        mem_percent = mem_info['percent']
+        total, available, used, mem_percent = mem_info.total, mem_info.available, mem_info.used, mem_info.percent
+        swap_total, swap_used, swap_percent = mem_info.swap_total, mem_info.swap_used, mem_info.swap_percent
         table.add_row("Memory:", f"[bold]{mem_percent:.1f}%[/bold]")
-        table.add_row("Used:", self.format_bytes(mem_info['used']))
-        table.add_row("Available:", self.format_bytes(mem_info['available']))
-        table.add_row("Total:", self.format_bytes(mem_info['total']))
-        table.add_row("", f"[{self._color(mem_percent)}]{self._bar(mem_percent)}[/{self._color(mem_percent)}]")
-        table.add_row("", ""); table.add_row("Swap:", f"{mem_info['swap_percent']:.1f}%")
-        table.add_row("Swap Used:", self.format_bytes(mem_info['swap_used']))
-        table.add_row("Swap Total:", self.format_bytes(mem_info['swap_total']))
+        table.add_row("Used:", self.format_bytes(used))
+        table.add_row("Available:", self.format_bytes(available))
+        table.add_row("Total:", self.format_bytes(total))
+        table.add_row("", self._colored_bar[int(mem_percent)])
+        table.add_row("", ""); table.add_row("Swap:", f"{swap_percent:.1f}%")
+        table.add_row("Swap Used:", self.format_bytes(swap_used))
+        table.add_row("Swap Total:", self.format_bytes(swap_total))
         return Panel(table, title="[bold green]Memory[/bold green]", border_style="green")
     
+    @staticmethod
+    def _clear_rows(table):
+        # Rich stores cells on each Column as well as in the Row list
+        for column in table.columns:
+            column._cells.clear()
+        table.rows.clear()
+    
     def create_disk_panel(self, disk_info):
-        table = Table(show_header=True, box=None, padding=(0, 1))
-        table.add_column("Device", style="cyan")
-        table.add_column("Mount", style="magenta")
-        table.add_column("Usage", justify="right")
-        table.add_column("Used", justify="right")
-        table.add_column("Total", justify="right")
+        table = self._disk_table
+        self._clear_rows(table)
         for disk in disk_info[:5]:
-            usage = disk['percent']
-            bar = "█" * int(usage / 5) + "░" * (20 - int(usage / 5))
+            usage = disk.percent
+            open_tag, close_tag = self._COLOR_TAGS[self._color(usage, (70, 90))]
             table.add_row(
-                disk['device'], disk['mountpoint'],
-                f"[{self._color(usage, (70, 90))}]{usage:5.1f}% {bar}[/{self._color(usage, (70, 90))}]",
-                self.format_bytes(disk['used']), self.format_bytes(disk['total'])
+                disk.device, disk.mountpoint,
+                f"{open_tag}{usage:5.1f}% {self._bar20[int(usage)]}{close_tag}",
+                self.format_bytes(disk.used), self.format_bytes(disk.total)
             )
-        return Panel(table, title="[bold yellow]Disk[/bold yellow]", border_style="yellow")
+        return self._disk_panel
     
     def create_network_panel(self, net_info):
         table = Table(show_header=False, box=None, padding=(0, 1))
-        table.add_row("Bytes Sent:", f"[bold]{self.format_bytes(net_info['bytes_sent'])}[/bold]")
-        table.add_row("Bytes Received:", f"[bold]{self.format_bytes(net_info['bytes_recv'])}[/bold]")
-        table.add_row("Packets Sent:", f"{net_info['packets_sent']:,}")
-        table.add_row("Packets Received:", f"{net_info['packets_recv']:,}")
-        table.add_row("Errors In:", f"[red]{net_info['errin']:,}[/red]" if net_info['errin'] > 0 else f"{net_info['errin']:,}")
-        table.add_row("Errors Out:", f"[red]{net_info['errout']:,}[/red]" if net_info['errout'] > 0 else f"{net_info['errout']:,}")
-        table.add_row("Active Connections:", str(net_info['connections']))
+        bytes_sent, bytes_recv = net_info.bytes_sent, net_info.bytes_recv
+        packets_sent, packets_recv = net_info.packets_sent, net_info.packets_recv
+        errin, errout, connections = net_info.errin, net_info.errout, net_info.connections
+        table.add_row("Bytes Sent:", f"[bold]{self.format_bytes(bytes_sent)}[/bold]")
+        table.add_row("Bytes Received:", f"[bold]{self.format_bytes(bytes_recv)}[/bold]")
+        table.add_row("Packets Sent:", f"{packets_sent:,}")
+        table.add_row("Packets Received:", f"{packets_recv:,}")
+        table.add_row("Errors In:", f"[red]{errin:,}[/red]" if errin > 0 else f"{errin:,}")
+        table.add_row("Errors Out:", f"[red]{errout:,}[/red]" if errout > 0 else f"{errout:,}")
+        table.add_row("Active Connections:", str(connections))
         return Panel(table, title="[bold magenta]Network[/bold magenta]", border_style="magenta")
     
     def create_process_table(self, processes):
-        table = Table(show_header=True, box=None, padding=(0, 1))
-        table.add_column("PID", style="cyan", width=8)
-        table.add_column("Name", style="green", width=20)
-        table.add_column("CPU %", justify="right", width=10)
-        table.add_column("Memory %", justify="right", width=12)
-        table.add_column("Status", width=10)
+        table = self._proc_table
+        self._clear_rows(table)
         for proc in processes:
-            status_color = "green" if proc['status'] == "running" else "yellow"
+            status = proc.status
             table.add_row(
-                str(proc['pid']), proc['name'][:20],
-                f"{proc['cpu_percent']:5.1f}%", f"{proc['memory_percent']:5.1f}%",
-                f"[{status_color}]{proc['status']}[/{status_color}]"
+                str(proc.pid), proc.name[:20],
+                f"{proc.cpu_percent:5.1f}%", f"{proc.memory_percent:5.1f}%",
+                self._STATUS_MARKUP.get(status) or f"[yellow]{status}[/yellow]"
             )
-        return Panel(table, title="[bold blue]Top Processes[/bold blue]", border_style="blue")
+        return self._proc_panel
+    
+    def _cw_worker(self):
+        while True:
+            metrics = self._cw_queue.get()
+            try:
+                for i in range(0, len(metrics), 20):
+                    self.cloudwatch.put_metric_data(Namespace=self.namespace, MetricData=metrics[i:i+20])
+            except Exception:
+                pass
     
     def send_to_cloudwatch(self, cpu_info, mem_info, disk_info, net_info):
         if not self.cloudwatch_enabled:
             return
         try:
-            timestamp = datetime.utcnow()
+            # Standard resolution stores one point per minute, so align the timestamp to it
+            timestamp = datetime.now(timezone.utc).replace(second=0, microsecond=0)
             metrics = [
-                {'MetricName': 'CPUUtilization', 'Value': cpu_info['total'], 'Unit': 'Percent', 'Timestamp': timestamp},
-                {'MetricName': 'MemoryUtilization', 'Value': mem_info['percent'], 'Unit': 'Percent', 'Timestamp': timestamp},
-                {'MetricName': 'NetworkBytesSent', 'Value': net_info['bytes_sent'], 'Unit': 'Bytes', 'Timestamp': timestamp},
-                {'MetricName': 'NetworkBytesReceived', 'Value': net_info['bytes_recv'], 'Unit': 'Bytes', 'Timestamp': timestamp}
+                {'MetricName': 'CPUUtilization', 'Value': cpu_info.total, 'Unit': 'Percent', 'Timestamp': timestamp, 'StorageResolution': 60},
+                {'MetricName': 'MemoryUtilization', 'Value': mem_info.percent, 'Unit': 'Percent', 'Timestamp': timestamp, 'StorageResolution': 60},
+                {'MetricName': 'NetworkBytesSent', 'Value': net_info.bytes_sent, 'Unit': 'Bytes', 'Timestamp': timestamp, 'StorageResolution': 60},
+                {'MetricName': 'NetworkBytesReceived', 'Value': net_info.bytes_recv, 'Unit': 'Bytes', 'Timestamp': timestamp, 'StorageResolution': 60}
             ]
-            for disk in disk_info:
+            # Host-level aggregates are two custom metrics regardless of how many partitions exist
+            if disk_info:
+                percents = [disk.percent for disk in disk_info]
+                metrics.append({'MetricName': 'DiskUtilizationMax', 'Value': max(percents), 'Unit': 'Percent', 'Timestamp': timestamp, 'StorageResolution': 60})
+                metrics.append({'MetricName': 'DiskUtilizationMean', 'Value': sum(percents) / len(percents), 'Unit': 'Percent', 'Timestamp': timestamp, 'StorageResolution': 60})
+            for disk in disk_info if self.detailed_disk_metrics else ():
                 metrics.append({
-                    'MetricName': 'DiskUtilization', 'Value': disk['percent'], 'Unit': 'Percent',
-                    'Timestamp': timestamp, 'Dimensions': [
-                        {'Name': 'Device', 'Value': disk['device']},
-                        {'Name': 'MountPoint', 'Value': disk['mountpoint']}
+                    'MetricName': 'DiskUtilization', 'Value': disk.percent, 'Unit': 'Percent',
+                    'Timestamp': timestamp, 'StorageResolution': 60, 'Dimensions': [
+                        {'Name': 'Device', 'Value': disk.device},
+                        {'Name': 'MountPoint', 'Value': disk.mountpoint}
                     ]
                 })
-            for i in range(0, len(metrics), 20):
-                self.cloudwatch.put_metric_data(Namespace=self.namespace, MetricData=metrics[i:i+20])
         except Exception:
-            pass
+            return
+        try:
+            self._cw_queue.put_nowait(metrics)
+        except queue.Full:
+            # Drop the oldest pending batch in favour of the newest one
+            try:
+                self._cw_queue.get_nowait()
+            except queue.Empty:
+                pass
+            try:
+                self._cw_queue.put_nowait(metrics)
+            except queue.Full:
+                pass
     
-    def create_layout(self, cpu_info, mem_info, disk_info, net_info, processes):
-        header_text = Text("Linux System Monitor", style="bold white on blue")
-        header_text.append(f" | {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", style="dim")
-        if self.cloudwatch_enabled:
-            header_text.append(" | CloudWatch: ON", style="green")
-        header = Panel(header_text, border_style="blue")
-        footer = Panel(Text("Press Ctrl+C to exit", style="dim"), border_style="dim")
-        
-        layout = Layout()
-        layout.split(Layout(header, name="header", size=3), Layout(name="main"), Layout(footer, name="footer", size=3))
-        layout["main"].split_row(Layout(name="left"), Layout(name="right"))
-        layout["left"].split(Layout(name="cpu_mem"), Layout(self.create_disk_panel(disk_info), name="disk"))
-        layout["cpu_mem"].split_row(Layout(self.create_cpu_panel(cpu_info), name="cpu"), Layout(self.create_memory_panel(mem_info), name="mem"))
-        layout["right"].split(Layout(self.create_network_panel(net_info), name="network"), Layout(self.create_process_table(processes), name="processes"))
-        return layout
+    def _build_layout_skeleton(self):
+        self.layout = Layout()
+        self.layout.split(Layout(name="header", size=3), Layout(name="main"),
+                          Layout(Panel(Text("Press Ctrl+C to exit", style="dim"), border_style="dim"), name="footer", size=3))
+        self.layout["main"].split_row(Layout(name="left"), Layout(name="right"))
+        self.layout["left"].split(Layout(name="cpu_mem"), Layout(name="disk"))
+        self.layout["cpu_mem"].split_row(Layout(name="cpu"), Layout(name="mem"))
+        self.layout["right"].split(Layout(name="network"), Layout(name="processes"))
+        # Disk and process tables keep their columns; each frame only replaces the rows
+        self._disk_table = Table(show_header=True, box=None, padding=(0, 1))
+        self._disk_table.add_column("Device", style="cyan")
+        self._disk_table.add_column("Mount", style="magenta")
+        self._disk_table.add_column("Usage", justify="right")
+        self._disk_table.add_column("Used", justify="right")
+        self._disk_table.add_column("Total", justify="right")
+        self._disk_panel = Panel(self._disk_table, title="[bold yellow]Disk[/bold yellow]", border_style="yellow")
+        self._proc_table = Table(show_header=True, box=None, padding=(0, 1))
+        self._proc_table.add_column("PID", style="cyan", width=8)
+        self._proc_table.add_column("Name", style="green", width=20)
+        self._proc_table.add_column("CPU %", justify="right", width=10)
+        self._proc_table.add_column("Memory %", justify="right", width=12)
+        self._proc_table.add_column("Status", width=10)
+        self._proc_panel = Panel(self._proc_table, title="[bold blue]Top Processes[/bold blue]", border_style="blue")
+        self._header_panel = Panel(Text(""), border_style="blue")
+        self.layout["header"].update(self._header_panel)
+        self._cpu_slot = self.layout["cpu"]
+        self._mem_slot = self.layout["mem"]
+        self._disk_slot = self.layout["disk"]
+        self._network_slot = self.layout["network"]
+        self._processes_slot = self.layout["processes"]
+    
+    def update_layout(self, cpu_info, mem_info, disk_info, net_info, processes):
+        # The header clock only has second resolution, so rebuild its text once per second
+        sec = int(time.time())
+        if sec != self._last_sec:
+            self._last_sec = sec
+            header_text = Text("Linux System Monitor", style="bold white on blue")
+            header_text.append(f" | {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(sec))}", style="dim")
+            if self.cloudwatch_enabled:
+                header_text.append(" | CloudWatch: ON", style="green")
+            self._header_panel.renderable = header_text
+        self._cpu_slot.update(self.create_cpu_panel(cpu_info))
+        self._mem_slot.update(self.create_memory_panel(mem_info))
+        self._disk_slot.update(self.create_disk_panel(disk_info))
+        self._network_slot.update(self.create_network_panel(net_info))
+        self._processes_slot.update(self.create_process_table(processes))
     
     def collect_metrics(self):
         def safe_get(func, default):
@@ -235,36 +469,73 @@ class SystemMonitor:
                 return default
         
         return (
-            safe_get(self.get_cpu_info, {'total': 0, 'count': 1, 'per_core': [0], 'frequency': None}),
-            safe_get(self.get_memory_info, {'total': 0, 'available': 0, 'used': 0, 'percent': 0, 'swap_total': 0, 'swap_used': 0, 'swap_percent': 0}),
-            safe_get(self.get_disk_info, []),
-            safe_get(self.get_network_info, {'bytes_sent': 0, 'bytes_recv': 0, 'packets_sent': 0, 'packets_recv': 0, 'errin': 0, 'errout': 0, 'connections': 0}),
-            safe_get(lambda: self.get_process_info(), [])
+            # CPU and memory refresh every collector tick; the slower metrics are throttled
+            safe_get(self.get_cpu_info, CpuInfo(0, 1, [0], None)),
+            safe_get(self.get_memory_info, MemInfo(0, 0, 0, 0, 0, 0, 0)),
+            safe_get(lambda: self._throttle('disk', 5.0, self.get_disk_info), []),
+            safe_get(lambda: self._throttle('network', 2.0, self.get_network_info), NetInfo(0, 0, 0, 0, 0, 0, 0)),
+            safe_get(lambda: self._throttle('processes', 1.0, self.get_process_info), [])
         )
     
+    @staticmethod
+    def _wait_next(deadline, interval=_REFRESH_INTERVAL):
+        # Sleep to an absolute deadline so the loop's own work is absorbed into the interval
+        deadline += interval
+        remaining = deadline - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
+            return deadline
+        # Fell behind after a stall: restart the cadence from now rather than bursting to catch up
+        return time.monotonic()
+    
+    def _collector_loop(self):
+        # psutil and /proc reads run here so a slow collector never delays a redraw.
+        # run() has just taken a snapshot, so wait a full interval before the first sample;
+        # a non-blocking cpu_percent over a sub-tick window reads only 0% or 100%.
+        deadline = self._wait_next(time.monotonic())
+        while self.running:
+            snap = self.collect_metrics()
+            with self._snap_lock:
+                self._snap = snap
+            deadline = self._wait_next(deadline)
+    
     def run(self):
-        cloudwatch_counter = 0
-        cpu_info, mem_info, disk_info, net_info, processes = self.collect_metrics()
-        initial_layout = self.create_layout(cpu_info, mem_info, disk_info, net_info, processes)
+        # Scheduled on the monotonic clock so the 60 s cadence doesn't drift with frame time
+        next_cloudwatch = time.monotonic() + 60
+        # The first frame's CPU reading needs a full interval since the prime in __init__
+        remaining = self._cpu_primed_at + _REFRESH_INTERVAL - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
+        self._snap = self.collect_metrics()
+        self.update_layout(*self._snap)
+        threading.Thread(target=self._collector_loop, daemon=True).start()
         
-        with Live(initial_layout, console=self.console, refresh_per_second=2, screen=True) as live:
+        # Redraws happen only via live.refresh() below, so tables are never rendered mid-update
+        with Live(self.layout, console=self.console, auto_refresh=False, screen=True) as live:
+            deadline = time.monotonic()
             while self.running:
                 try:
-                    cpu_info, mem_info, disk_info, net_info, processes = self.collect_metrics()
+                    with self._snap_lock:
+                        cpu_info, mem_info, disk_info, net_info, processes = self._snap
                     
-                    if self.cloudwatch_enabled:
-                        cloudwatch_counter += 1
-                        if cloudwatch_counter >= 120:
-                            self.send_to_cloudwatch(cpu_info, mem_info, disk_info, net_info)
-                            cloudwatch_counter = 0
+                    now = time.monotonic()
+                    if self.cloudwatch_enabled and now >= next_cloudwatch:
+                        self.send_to_cloudwatch(cpu_info, mem_info, disk_info, net_info)
+                        # Advance by whole periods so frame lateness doesn't accumulate; after a
+                        # long stall, skip ahead instead of sending a backlog of batches
+                        next_cloudwatch += 60
+                        if next_cloudwatch <= now:
+                            next_cloudwatch = now + 60
                     
-                    live.update(self.create_layout(cpu_info, mem_info, disk_info, net_info, processes))
-                    time.sleep(0.5)
+                    self.update_layout(cpu_info, mem_info, disk_info, net_info, processes)
+                    live.refresh()
+                    deadline = self._wait_next(deadline)
                 except KeyboardInterrupt:
                     break
                 except Exception:
                     time.sleep(1)
         
+        self.running = False
         self.console.print("\n[green]Monitoring stopped.[/green]")
 
 
@@ -273,12 +544,14 @@ def main():
     parser.add_argument('--cloudwatch', action='store_true', help='Enable CloudWatch metrics export')
     parser.add_argument('--region', default='us-east-1', help='AWS region for CloudWatch')
     parser.add_argument('--namespace', default='SystemMonitor', help='CloudWatch namespace')
+    parser.add_argument('--detailed-disk-metrics', action='store_true', help='Also send per-partition DiskUtilization to CloudWatch')
     
     args = parser.parse_args()
     monitor = SystemMonitor(
         cloudwatch_enabled=args.cloudwatch,
         cloudwatch_region=args.region,
-        namespace=args.namespace
+        namespace=args.namespace,
+        detailed_disk_metrics=args.detailed_disk_metrics
     )
     monitor.run()
 